@@ -0,0 +1,221 @@
+"""
+Adalex UI Tables
+
+Helpers for building Table component context from request parameters.
+"""
+from functools import reduce
+from operator import or_
+from urllib.parse import urlencode
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q, QuerySet
+
+from .utils import build_pagination_data
+
+
+def build_table_context(rows, columns, request, page_size=10, base_url=None,
+                        search_fields=None, filter_rows=None, sort_rows=None):
+    """
+    Build search, sort and pagination context for the Table component.
+
+    Reads ``search``, ``sort``, ``direction`` and ``page`` from ``request.GET``.
+    QuerySets are filtered and ordered in the database, related columns are
+    loaded with ``select_related``/``prefetch_related`` and only the current
+    page is fetched (LIMIT/OFFSET); an unordered QuerySet is ordered by primary
+    key so pages don't overlap. Lists and tuples are filtered and sorted in memory.
+
+    Args:
+        rows: QuerySet, or sequence of dicts
+        columns (list): Column dicts with 'key' and optional 'sortable'
+        request: Django HTTP request object
+        page_size (int): Number of rows per page
+        base_url (str): URL the pagination links point to (defaults to request.path)
+        search_fields (list): Keys matched by the search query (defaults to the column keys;
+            for QuerySets, the columns that are plain model fields)
+        filter_rows (callable): Optional ``(rows, query) -> rows`` override for searching;
+            it may return a QuerySet or a list
+        sort_rows (callable): Optional ``(rows, key, descending) -> rows`` override for sorting;
+            it may return a QuerySet or a list
+
+    Returns:
+        dict: Context with 'columns', 'rows', 'search_query', 'sort_key',
+            'sort_direction', 'pagination_data', 'current_page', 'total_pages'
+            and 'total_records'
+
+    Example:
+        >>> context = build_table_context(User.objects.all(), columns, request)
+        >>> context['rows']  # at most 10 rows for the requested page
+    """
+    query = request.GET
+    search_query = query.get('search', '').strip()
+    sort_key = query.get('sort', '')
+    sort_direction = query.get('direction', 'asc')
+    raw_page = query.get('page', '1')
+    # Page numbers longer than 9 digits are treated as invalid, which also keeps
+    # int() clear of its 4300-digit limit (ValueError)
+    page = int(raw_page) if raw_page.isdecimal() and len(raw_page) <= 9 else 1
+
+    column_keys = [column['key'] for column in columns]
+    is_queryset = isinstance(rows, QuerySet)
+    plain_keys = select = ()
+
+    if is_queryset:
+        plain_keys, select, prefetch = _classify_columns(rows.model, column_keys)
+        if select:
+            rows = rows.select_related(*select)
+        if prefetch:
+            rows = rows.prefetch_related(*prefetch)
+        if search_fields is None:
+            search_fields = plain_keys
+    elif search_fields is None:
+        search_fields = column_keys
+
+    # Filter, then sort only the matches
+    if search_query:
+        if filter_rows is not None:
+            rows = filter_rows(rows, search_query)
+            is_queryset = isinstance(rows, QuerySet)
+        elif is_queryset:
+            rows = _filter_queryset(rows, search_query, search_fields)
+        else:
+            rows = _filter_sequence(rows, search_query, search_fields)
+
+    sortable_keys = {column['key'] for column in columns if column.get('sortable')}
+    if sort_key in sortable_keys:
+        descending = sort_direction == 'desc'
+        if sort_rows is not None:
+            rows = sort_rows(rows, sort_key, descending)
+            is_queryset = isinstance(rows, QuerySet)
+        elif is_queryset:
+            # Only order by model fields; other keys (e.g. properties) would raise FieldError
+            if sort_key in plain_keys or sort_key in select:
+                rows = rows.order_by(f"-{sort_key}" if descending else sort_key)
+        else:
+            rows = sorted(rows, key=_missing_last(sort_key), reverse=descending)
+
+    # LIMIT/OFFSET over an unordered QuerySet can repeat or skip rows between pages
+    if is_queryset and not rows.ordered:
+        rows = rows.order_by('pk')
+
+    # Calculate pagination
+    total_records = rows.count() if is_queryset else len(rows)
+    total_pages = max(1, (total_records + page_size - 1) // page_size)
+    page = max(1, min(page, total_pages))  # Ensure page is within range
+
+    start_idx = (page - 1) * page_size
+    page_rows = rows[start_idx:start_idx + page_size]
+
+    # The search/sort part of the query string is the same for every page link;
+    # urlencode escapes braces, so it cannot clash with the {page} placeholder
+    prefix_params = []
+    if search_query:
+        prefix_params.append(('search', search_query))
+    if sort_key:
+        prefix_params.append(('sort', sort_key))
+        prefix_params.append(('direction', sort_direction))
+    if base_url is None:
+        base_url = request.path
+    if prefix_params:
+        page_url_prefix = f'{base_url}?{urlencode(prefix_params)}&page='
+    else:
+        page_url_prefix = f'{base_url}?page='
+
+    return {
+        'columns': columns,
+        'rows': page_rows,
+        'search_query': search_query,
+        'sort_key': sort_key,
+        'sort_direction': sort_direction,
+        'pagination_data': build_pagination_data(page, total_pages, page_url_prefix + '{page}'),
+        'current_page': page,
+        'total_pages': total_pages,
+        'total_records': total_records,
+    }
+
+
+def _classify_columns(model, column_keys):
+    """
+    Sort column keys into plain model fields and relations to preload.
+
+    Forward relations are joined with select_related; multi-valued ones and
+    GenericForeignKeys are prefetched, so a column showing a related object
+    doesn't cost a query per row.
+
+    Args:
+        model: Model class of the QuerySet
+        column_keys (list): Column keys, matched against model field names
+
+    Returns:
+        tuple: (plain_keys, select_related_keys, prefetch_related_keys); keys
+            that are not model fields (e.g. properties) are left out
+    """
+    plain, select, prefetch = [], [], []
+    for key in column_keys:
+        try:
+            field = model._meta.get_field(key)
+        except FieldDoesNotExist:
+            continue
+        if not field.is_relation:
+            plain.append(key)
+        elif (field.many_to_one or field.one_to_one) and field.related_model is not None:
+            select.append(key)
+        else:
+            # Multi-valued relations and GenericForeignKeys (no single related model)
+            prefetch.append(key)
+    return plain, select, prefetch
+
+
+def _missing_last(key):
+    """
+    Build a sort key for dict rows that tolerates rows without ``key``.
+
+    Missing (or None) values sort after every other value, and first when the
+    sort is reversed; they are never compared with the real values.
+
+    Args:
+        key (str): Row key to sort by
+
+    Returns:
+        callable: ``row -> (is_missing, value)`` sort key
+    """
+    def sort_key(row):
+        value = row.get(key)
+        return (value is None, value)
+    return sort_key
+
+
+def _filter_queryset(queryset, search_query, search_fields):
+    """
+    Filter a QuerySet to rows where any search field contains the query.
+
+    Args:
+        queryset (QuerySet): Rows to filter
+        search_query (str): Text to look for (case-insensitive)
+        search_fields (list): Model field lookups to search
+
+    Returns:
+        QuerySet: Filtered queryset
+    """
+    if not search_fields:
+        return queryset
+    condition = reduce(or_, (Q(**{f"{field}__icontains": search_query}) for field in search_fields))
+    return queryset.filter(condition)
+
+
+def _filter_sequence(rows, search_query, search_fields):
+    """
+    Filter in-memory rows to those where any search field contains the query.
+
+    Args:
+        rows: Sequence of dicts
+        search_query (str): Text to look for (case-insensitive)
+        search_fields (list): Keys to search
+
+    Returns:
+        list: Matching rows, in their original order
+    """
+    needle = search_query.lower()
+    return [
+        row for row in rows
+        if any(needle in str(row.get(field, '')).lower() for field in search_fields)
+    ]
@@ -3,15 +3,70 @@ Adalex UI Template Tags and Filters.
 
 Custom template tags and filters for the Adalex UI component library.
 """
+from collections.abc import Mapping
+from functools import lru_cache
+from string import Formatter
+
 from django import template
 
 register = template.Library()
 
 
+@lru_cache(maxsize=256)
+def _pattern_fields(pattern):
+    """
+    Return the top-level names referenced by a format pattern.
+
+    Args:
+        pattern: String pattern with {key} placeholders
+
+    Returns:
+        Tuple of unique field names in order of appearance (e.g. "{user.id}" -> "user")
+    """
+    names = []
+    for _, field_name, _, _ in Formatter().parse(pattern):
+        if field_name:
+            name = field_name.split('.', 1)[0].split('[', 1)[0]
+            if name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern):
+    """
+    Compile a format pattern into a renderer so it is parsed only once.
+
+    Args:
+        pattern: String pattern with {key} placeholders
+
+    Returns:
+        Callable taking a mapping of field values and returning the formatted string
+    """
+    segments = tuple(Formatter().parse(pattern))
+
+    # Attribute/index access, format specs and conversions keep str.format semantics
+    if any(
+        field_name is not None and (not field_name.isidentifier() or format_spec or conversion)
+        for _, field_name, format_spec, conversion in segments
+    ):
+        return lambda values: pattern.format(**values)
+
+    def render(values):
+        parts = []
+        for literal, field_name, _, _ in segments:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(format(values[field_name]))
+        return ''.join(parts)
+
+    return render
+
+
 @register.filter
 def get_item(dictionary, key):
     """
-    Safe accessor for dictionary or object attributes.
+    Safe accessor for dictionary (or other mapping) keys or object attributes.
 
     Usage in templates:
         {{ my_dict|get_item:"key_name" }}
@@ -24,17 +79,47 @@ def get_item(dictionary, key):
     Returns:
         Value from dictionary/object or None if not found
     """
+    # Exact dict check first: the common case for table rows
+    if type(dictionary) is dict:
+        return dictionary.get(key)
+
     if dictionary is None:
         return None
 
-    # Try dictionary access first
-    if isinstance(dictionary, dict):
+    # Other mappings (dict subclasses, MappingProxyType, ChainMap, ...)
+    if isinstance(dictionary, Mapping):
         return dictionary.get(key)
 
     # Try object attribute access
     return getattr(dictionary, key, None)
 
 
+@lru_cache(maxsize=256)
+def _split_keys(keys):
+    """Split a comma-separated key list into a tuple of stripped names."""
+    return tuple(key.strip() for key in keys.split(',') if key.strip())
+
+
+@register.filter
+def get_items(dictionary, keys):
+    """
+    Fetch several keys or attributes in a single filter call.
+
+    Usage in templates:
+        {% with vals=row|get_items:"id,name,email" %}
+          {{ vals.id }} {{ vals.name }} {{ vals.email }}
+        {% endwith %}
+
+    Args:
+        dictionary: Dictionary or object to access
+        keys: Comma-separated string of keys or attribute names
+
+    Returns:
+        Dictionary mapping each key to its value (None if not found)
+    """
+    return {key: get_item(dictionary, key) for key in _split_keys(keys)}
+
+
 @register.filter
 def format_with(pattern, obj):
     """
@@ -54,16 +139,23 @@ def format_with(pattern, obj):
     if pattern is None or obj is None:
         return pattern
 
+    # Nothing to substitute or unescape
+    if '{' not in pattern and '}' not in pattern:
+        return pattern
+
     # If obj is a dictionary
     if isinstance(obj, dict):
         try:
-            return pattern.format(**obj)
+            return _compile_pattern(pattern)(obj)
         except (KeyError, ValueError):
             return pattern
 
-    # If obj is an object, convert its attributes to dict
+    # If obj is an object, look up only the attributes the pattern references
     try:
-        obj_dict = {key: getattr(obj, key, None) for key in dir(obj) if not key.startswith('_')}
-        return pattern.format(**obj_dict)
+        fields = _pattern_fields(pattern)
+        if any(key.startswith('_') for key in fields):
+            return pattern
+        obj_dict = {key: getattr(obj, key) for key in fields}
+        return _compile_pattern(pattern)(obj_dict)
     except (KeyError, ValueError, AttributeError):
         return pattern
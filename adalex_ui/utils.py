@@ -3,27 +3,42 @@ Adalex UI Utilities
 
 Helper functions for components.
 """
+from functools import lru_cache
+from types import MappingProxyType
+
+# Shared read-only entry used for every ellipsis slot in pagination data
+_ELLIPSIS_PAGE = MappingProxyType({
+    'number': None,
+    'url': None,
+    'is_active': False,
+    'is_ellipsis': True,
+})
 
 
 def build_pagination_data(current_page, total_pages, url_pattern, max_visible=7):
     """
     Build pagination data for template rendering.
 
+    Results are cached per argument combination, so the page entries are shared
+    read-only mappings. Copy an entry (e.g. ``dict(page)``) before modifying it.
+
     Args:
         current_page (int): Current active page number (1-indexed)
         total_pages (int): Total number of pages
-        url_pattern (str): URL pattern with {page} placeholder (e.g., "/items/?page={page}")
+        url_pattern (str): URL pattern with {page} placeholder (e.g., "/items/?page={page}");
+            every occurrence is replaced by the page number
         max_visible (int): Maximum number of page links to show
 
     Returns:
         dict: Pagination data ready for template rendering with keys:
-            - pages: List of page dicts with 'number', 'url', 'is_active', 'is_ellipsis'
+            - pages: Tuple of read-only page mappings with 'number', 'url',
+              'is_active', 'is_ellipsis'
             - prev_url: URL for previous page or None
             - next_url: URL for next page or None
 
     Example:
         >>> pagination = build_pagination_data(5, 10, "/items/?page={page}")
-        >>> pagination['pages']
+        >>> [dict(page) for page in pagination['pages']]
         [
             {'number': 1, 'url': '/items/?page=1', 'is_active': False, 'is_ellipsis': False},
             {'number': None, 'url': None, 'is_active': False, 'is_ellipsis': True},
@@ -32,52 +47,78 @@ def build_pagination_data(current_page, total_pages, url_pattern, max_visible=7)
             ...
         ]
     """
-    pages = []
-
-    # Calculate which pages to show
-    if total_pages <= max_visible:
-        # Show all pages
-        page_numbers = range(1, total_pages + 1)
-    else:
-        # Smart pagination with ellipsis
-        half = max_visible // 2
-        if current_page <= half + 1:
-            # Near start
-            page_numbers = list(range(1, max_visible - 1)) + [None, total_pages]
-        elif current_page >= total_pages - half:
-            # Near end
-            page_numbers = [1, None] + list(range(total_pages - max_visible + 3, total_pages + 1))
-        else:
-            # Middle
-            page_numbers = (
-                [1, None] +
-                list(range(current_page - half + 2, current_page + half - 1)) +
-                [None, total_pages]
-            )
-
-    # Build page data
-    for num in page_numbers:
-        if num is None:
-            pages.append({
-                'number': None,
-                'url': None,
-                'is_active': False,
-                'is_ellipsis': True,
-            })
-        else:
-            pages.append({
-                'number': num,
-                'url': url_pattern.replace('{page}', str(num)),
-                'is_active': num == current_page,
-                'is_ellipsis': False,
-            })
-
-    # Build prev/next URLs
-    prev_url = None if current_page <= 1 else url_pattern.replace('{page}', str(current_page - 1))
-    next_url = None if current_page >= total_pages else url_pattern.replace('{page}', str(current_page + 1))
+    pages, prev_url, next_url = _compute_pagination(
+        current_page, total_pages, url_pattern, max_visible)
 
     return {
         'pages': pages,
         'prev_url': prev_url,
         'next_url': next_url,
     }
+
+
+@lru_cache(maxsize=512)
+def _compute_pagination(current_page, total_pages, url_pattern, max_visible):
+    """
+    Compute the immutable parts of build_pagination_data().
+
+    Returns:
+        tuple: (pages, prev_url, next_url) where pages is a tuple of MappingProxyType
+    """
+    # Split the pattern once instead of scanning it for every page URL
+    parts = url_pattern.split('{page}')
+
+    # Build page data
+    pages = tuple([
+        _ELLIPSIS_PAGE if num is None else MappingProxyType({
+            'number': num,
+            'url': str(num).join(parts),
+            'is_active': num == current_page,
+            'is_ellipsis': False,
+        })
+        for num in _iter_page_numbers(current_page, total_pages, max_visible)
+    ])
+
+    # Build prev/next URLs
+    prev_url = None if current_page <= 1 else str(current_page - 1).join(parts)
+    next_url = None if current_page >= total_pages else str(current_page + 1).join(parts)
+
+    return pages, prev_url, next_url
+
+
+def _iter_page_numbers(current_page, total_pages, max_visible):
+    """
+    Yield the page numbers to show, with None marking an ellipsis.
+
+    Args:
+        current_page (int): Current active page number (1-indexed)
+        total_pages (int): Total number of pages
+        max_visible (int): Maximum number of page links to show
+
+    Yields:
+        int or None: Page number, or None for an ellipsis slot
+    """
+    if total_pages <= max_visible:
+        # Show all pages
+        yield from range(1, total_pages + 1)
+        return
+
+    # Smart pagination with ellipsis
+    half = max_visible // 2
+    if current_page <= half + 1:
+        # Near start
+        yield from range(1, max_visible - 1)
+        yield None
+        yield total_pages
+    elif current_page >= total_pages - half:
+        # Near end
+        yield 1
+        yield None
+        yield from range(total_pages - max_visible + 3, total_pages + 1)
+    else:
+        # Middle
+        yield 1
+        yield None
+        yield from range(current_page - half + 2, current_page + half - 1)
+        yield None
+        yield total_pages
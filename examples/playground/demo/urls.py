@@ -6,13 +6,14 @@ from . import views
 app_name = 'demo'
 
 urlpatterns = [
+    # Most visited pages first: URL resolution tries patterns in order
     path('', views.index, name='index'),
-    path('forms/basic/', views.forms_basic, name='forms_basic'),
-    path('forms/advanced/', views.forms_advanced, name='forms_advanced'),
-    path('forms/complete/', views.form_demo, name='form_demo'),
     path('components/ui/', views.components_ui, name='components_ui'),
     path('components/advanced/', views.components_advanced, name='components_advanced'),
     path('components/complex/', views.components_complex, name='components_complex'),
+    path('forms/basic/', views.forms_basic, name='forms_basic'),
+    path('forms/advanced/', views.forms_advanced, name='forms_advanced'),
+    path('forms/complete/', views.form_demo, name='form_demo'),
     path('navigation/', views.navigation_demo, name='navigation_demo'),
     path('table/', views.table_demo, name='table_demo'),
     path('auth/', views.auth_demo, name='auth_demo'),
@@ -1,10 +1,96 @@
 """Views for demo app"""
 
-from django.shortcuts import render, redirect
-from django.contrib import messages
+import gzip
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import cycle
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseRedirect
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.utils.cache import patch_response_headers, patch_vary_headers
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_http_methods, require_safe
+from adalex_ui.tables import build_table_context
 from adalex_ui.utils import build_pagination_data
 
 
+# Pages that render the same HTML for every request are cached for a day
+# (outside DEBUG, see _page_cache).
+# Views whose templates emit a CSRF token (auth_demo, form_demo and
+# accessibility_demo, which includes components/form.html) are left out so
+# that a cached token is never served to another visitor.
+_STATIC_PAGE_TIMEOUT = 60 * 60 * 24
+
+
+def _page_cache(timeout, **kwargs):
+    """
+    Return cache_page(timeout, **kwargs), or a no-op decorator under DEBUG.
+
+    The playground runs with DEBUG on while component templates are edited;
+    a cached page would keep serving the old HTML after a template change.
+
+    Args:
+        timeout (int): Cache lifetime in seconds
+        **kwargs: Extra arguments for cache_page (e.g. key_prefix)
+
+    Returns:
+        callable: View decorator
+    """
+    if settings.DEBUG:
+        return lambda view: view
+    return cache_page(timeout, **kwargs)
+
+
+def _freeze(value):
+    """
+    Recursively convert demo data into read-only structures.
+
+    Module-level context data is shared across requests, so dicts become
+    MappingProxyType and lists become tuples to prevent accidental mutation.
+
+    Args:
+        value: Dict, list or scalar value
+
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Pagination examples for components_advanced, computed once at import
+_PAGINATION_EXAMPLES = {
+    'pagination_1': build_pagination_data(1, 10, "/demo/?page={page}"),
+    'pagination_5': build_pagination_data(5, 10, "/demo/?page={page}"),
+    'pagination_10': build_pagination_data(10, 10, "/demo/?page={page}"),
+    'pagination_2_of_3': build_pagination_data(2, 3, "/demo/?page={page}"),
+}
+
+
+# Static contexts shared across requests (render() does not mutate them)
+_INDEX_CONTEXT = {
+    'title': 'Adalex UI Component Library',
+    'description': 'Interactive playground for Adalex UI components',
+}
+
+_COMPONENTS_UI_CONTEXT = {
+    'title': 'UI Components',
+    'description': 'Button, Alert, Badge, and Spinner components',
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def index(request):
     """
     Homepage view showing available component demos.
@@ -15,13 +101,31 @@ def index(request):
     Returns:
         Rendered template with component showcase
     """
-    context = {
-        'title': 'Adalex UI Component Library',
-        'description': 'Interactive playground for Adalex UI components',
-    }
-    return render(request, 'demo/index.html', context)
+    return render(request, 'demo/index.html', _INDEX_CONTEXT)
+
+
+# Country choices shared by the basic select demos and the contact form
+_COUNTRY_OPTIONS = _freeze([
+    {'value': 'tr', 'label': 'Turkey'},
+    {'value': 'us', 'label': 'United States'},
+    {'value': 'uk', 'label': 'United Kingdom'},
+    {'value': 'de', 'label': 'Germany'},
+    {'value': 'fr', 'label': 'France'},
+])
 
+_COUNTRY_OPTIONS_WITH_PLACEHOLDER = (
+    MappingProxyType({'value': '', 'label': 'Select a country...'}),
+) + _COUNTRY_OPTIONS
 
+_FORMS_BASIC_CONTEXT = {
+    'title': 'Basic Form Components',
+    'description': 'Label, TextInput, Textarea, and Select components',
+    'country_options': _COUNTRY_OPTIONS_WITH_PLACEHOLDER,
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def forms_basic(request):
     """
     Demo view for basic form components (label, text input, textarea, select).
@@ -32,21 +136,11 @@ def forms_basic(request):
     Returns:
         Rendered template showcasing form components
     """
-    context = {
-        'title': 'Basic Form Components',
-        'description': 'Label, TextInput, Textarea, and Select components',
-        'country_options': [
-            {'value': '', 'label': 'Select a country...'},
-            {'value': 'tr', 'label': 'Turkey'},
-            {'value': 'us', 'label': 'United States'},
-            {'value': 'uk', 'label': 'United Kingdom'},
-            {'value': 'de', 'label': 'Germany'},
-            {'value': 'fr', 'label': 'France'},
-        ],
-    }
-    return render(request, 'demo/forms_basic.html', context)
+    return render(request, 'demo/forms_basic.html', _FORMS_BASIC_CONTEXT)
 
 
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def components_ui(request):
     """
     Demo view for UI components (button, alert, badge, spinner).
@@ -57,13 +151,18 @@ def components_ui(request):
     Returns:
         Rendered template showcasing UI components
     """
-    context = {
-        'title': 'UI Components',
-        'description': 'Button, Alert, Badge, and Spinner components',
-    }
-    return render(request, 'demo/components_ui.html', context)
+    return render(request, 'demo/components_ui.html', _COMPONENTS_UI_CONTEXT)
+
+
+_COMPONENTS_ADVANCED_CONTEXT = {
+    'title': 'Advanced Components',
+    'description': 'Tooltip, Modal, Icon, and Pagination components',
+    **_PAGINATION_EXAMPLES,
+}
 
 
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def components_advanced(request):
     """
     Demo view for advanced components (tooltip, modal, icon, pagination).
@@ -74,23 +173,84 @@ def components_advanced(request):
     Returns:
         Rendered template showcasing advanced components
     """
-    # Pagination examples
-    pagination_1 = build_pagination_data(1, 10, "/demo/?page={page}")
-    pagination_5 = build_pagination_data(5, 10, "/demo/?page={page}")
-    pagination_10 = build_pagination_data(10, 10, "/demo/?page={page}")
-    pagination_2_of_3 = build_pagination_data(2, 3, "/demo/?page={page}")
+    return render(request, 'demo/components_advanced.html', _COMPONENTS_ADVANCED_CONTEXT)
+
+
+# Navbar data with dropdown examples
+_NAV_ITEMS = _freeze([
+    {'url': '#dashboard', 'text': 'Dashboard', 'active': True},
+    {
+        'text': 'Products', 
+        'active': False,
+        'children': [
+            {'url': '#products/list', 'text': 'Product List', 'active': False},
+            {'url': '#products/add', 'text': 'Add Product', 'active': False},
+            {'url': '#products/categories', 'text': 'Categories', 'active': False},
+            {'url': '#products/inventory', 'text': 'Inventory', 'active': False},
+        ]
+    },
+    {
+        'text': 'Sales', 
+        'active': False,
+        'children': [
+            {'url': '#sales/orders', 'text': 'Orders', 'active': False},
+            {'url': '#sales/invoices', 'text': 'Invoices', 'active': False},
+            {'url': '#sales/reports', 'text': 'Sales Reports', 'active': False},
+        ]
+    },
+    {'url': '#customers', 'text': 'Customers', 'active': False},
+])
+
+_USER_MENU = _freeze([
+    {'url': '#profile', 'text': 'Profile'},
+    {'url': '#settings', 'text': 'Settings'},
+    {'url': '#logout', 'text': 'Logout'},
+])
+
+# Sidebar data
+_SIDEBAR_ITEMS = _freeze([
+    {'url': '#dashboard', 'text': 'Dashboard', 'icon': 'star', 'active': True},
+    {'url': '#products', 'text': 'Products', 'icon': 'search', 'active': False},
+    {'url': '#orders', 'text': 'Orders', 'icon': 'check', 'active': False},
+    {'url': '#customers', 'text': 'Customers', 'icon': 'user', 'active': False},
+    {'url': '#analytics', 'text': 'Analytics', 'icon': 'info', 'active': False},
+    {'url': '#settings', 'text': 'Settings', 'icon': 'settings', 'active': False},
+])
+
+
+def _navigation_context():
+    """
+    Build the navigation demo context with the navbar and sidebar prerendered.
 
-    context = {
-        'title': 'Advanced Components',
-        'description': 'Tooltip, Modal, Icon, and Pagination components',
-        'pagination_1': pagination_1,
-        'pagination_5': pagination_5,
-        'pagination_10': pagination_10,
-        'pagination_2_of_3': pagination_2_of_3,
+    navigation_demo is page-cached outside DEBUG, so this runs once per cache
+    lifetime there rather than on every request.
+
+    Returns:
+        dict: Template context for the navigation demo
+    """
+    navbar_html = render_to_string('components/navbar.html', {
+        'logo_text': 'Adalex UI Demo',
+        'nav_items': _NAV_ITEMS,
+        'user_menu': _USER_MENU,
+        'user_name': 'John Doe',
+    })
+    sidebar_html = render_to_string('components/sidebar.html', {
+        'items': _SIDEBAR_ITEMS,
+        'collapsible': True,
+    })
+    return {
+        'title': 'Navigation Components',
+        'description': 'Navbar, Sidebar, and Dashboard Layout components',
+        'page_title': 'Navigation Components',
+        'page_description': 'Interactive demo of Navbar, Sidebar, and Dashboard Layout',
+        'site_name': 'Adalex UI Demo',
+        'navbar_html': navbar_html,
+        'sidebar_html': sidebar_html,
     }
-    return render(request, 'demo/components_advanced.html', context)
 
 
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def navigation_demo(request):
     """
     Demo view for navigation components (navbar, sidebar, dashboard layout).
@@ -101,61 +261,170 @@ def navigation_demo(request):
     Returns:
         Rendered template showcasing navigation components
     """
-    # Navbar data with dropdown examples
-    nav_items = [
-        {'url': '#dashboard', 'text': 'Dashboard', 'active': True},
-        {
-            'text': 'Products', 
-            'active': False,
-            'children': [
-                {'url': '#products/list', 'text': 'Product List', 'active': False},
-                {'url': '#products/add', 'text': 'Add Product', 'active': False},
-                {'url': '#products/categories', 'text': 'Categories', 'active': False},
-                {'url': '#products/inventory', 'text': 'Inventory', 'active': False},
-            ]
-        },
-        {
-            'text': 'Sales', 
-            'active': False,
-            'children': [
-                {'url': '#sales/orders', 'text': 'Orders', 'active': False},
-                {'url': '#sales/invoices', 'text': 'Invoices', 'active': False},
-                {'url': '#sales/reports', 'text': 'Sales Reports', 'active': False},
-            ]
-        },
-        {'url': '#customers', 'text': 'Customers', 'active': False},
-    ]
+    return render(request, 'demo/navigation_demo.html', _navigation_context())
+
+
+# Prepare form fields configuration
+_CONTACT_FORM_FIELDS = _freeze([
+    {
+        'type': 'text',
+        'name': 'full_name',
+        'label': 'Full Name',
+        'placeholder': 'Enter your full name',
+        'required': True,
+    },
+    {
+        'type': 'email',
+        'name': 'email',
+        'label': 'Email Address',
+        'placeholder': 'your.email@example.com',
+        'required': True,
+    },
+    {
+        'type': 'select',
+        'name': 'country',
+        'label': 'Country',
+        'required': True,
+        'placeholder': 'Select a country...',
+        'options': _COUNTRY_OPTIONS,
+    },
+    {
+        'type': 'textarea',
+        'name': 'message',
+        'label': 'Message',
+        'placeholder': 'Type your message here...',
+        'required': False,
+        'rows': 5,
+    },
+])
+
+# Compact registration form
+_REGISTRATION_FORM_FIELDS = _freeze([
+    {
+        'type': 'text',
+        'name': 'username',
+        'label': 'Username',
+        'placeholder': 'Choose a username',
+        'required': True,
+    },
+    {
+        'type': 'password',
+        'name': 'password',
+        'label': 'Password',
+        'placeholder': 'Enter a secure password',
+        'required': True,
+    },
+    {
+        'type': 'password',
+        'name': 'password_confirm',
+        'label': 'Confirm Password',
+        'placeholder': 'Re-enter your password',
+        'required': True,
+    },
+])
+
+
+# Profile form with various field types
+_PROFILE_FORM_FIELDS = _freeze([
+    {
+        'type': 'text',
+        'name': 'name',
+        'label': 'Full Name',
+        'value': 'John Doe',
+        'required': True,
+    },
+    {
+        'type': 'email',
+        'name': 'email',
+        'label': 'Email',
+        'value': 'john@example.com',
+        'required': True,
+    },
+    {
+        'type': 'tel',
+        'name': 'phone',
+        'label': 'Phone Number',
+        'placeholder': '+90 555 123 4567',
+    },
+    {
+        'type': 'url',
+        'name': 'website',
+        'label': 'Website',
+        'placeholder': 'https://yourwebsite.com',
+    },
+    {
+        'type': 'number',
+        'name': 'age',
+        'label': 'Age',
+        'min': 18,
+        'max': 120,
+        'value': 25,
+    },
+    {
+        'type': 'textarea',
+        'name': 'bio',
+        'label': 'Bio',
+        'placeholder': 'Tell us about yourself...',
+        'rows': 3,
+    },
+])
+
+# Survey form with radio and checkbox
+_SURVEY_FORM_FIELDS = _freeze([
+    {
+        'type': 'radio',
+        'name': 'experience',
+        'label': 'How would you rate your experience?',
+        'required': True,
+        'options': [
+            {'value': 'excellent', 'label': 'Excellent'},
+            {'value': 'good', 'label': 'Good'},
+            {'value': 'average', 'label': 'Average'},
+            {'value': 'poor', 'label': 'Poor'},
+        ],
+    },
+    {
+        'type': 'checkbox',
+        'name': 'newsletter',
+        'label': 'Subscribe to newsletter',
+        'help_text': 'I want to receive updates and promotions',
+    },
+    {
+        'type': 'select',
+        'name': 'frequency',
+        'label': 'Preferred contact frequency',
+        'placeholder': 'Choose frequency...',
+        'options': [
+            {'value': 'daily', 'label': 'Daily'},
+            {'value': 'weekly', 'label': 'Weekly'},
+            {'value': 'monthly', 'label': 'Monthly'},
+        ],
+    },
+    {
+        'type': 'textarea',
+        'name': 'comments',
+        'label': 'Additional Comments',
+        'placeholder': 'Any suggestions?',
+        'rows': 4,
+    },
+])
 
-    user_menu = [
-        {'url': '#profile', 'text': 'Profile'},
-        {'url': '#settings', 'text': 'Settings'},
-        {'url': '#logout', 'text': 'Logout'},
-    ]
 
-    # Sidebar data
-    sidebar_items = [
-        {'url': '#dashboard', 'text': 'Dashboard', 'icon': 'star', 'active': True},
-        {'url': '#products', 'text': 'Products', 'icon': 'search', 'active': False},
-        {'url': '#orders', 'text': 'Orders', 'icon': 'check', 'active': False},
-        {'url': '#customers', 'text': 'Customers', 'icon': 'user', 'active': False},
-        {'url': '#analytics', 'text': 'Analytics', 'icon': 'info', 'active': False},
-        {'url': '#settings', 'text': 'Settings', 'icon': 'settings', 'active': False},
-    ]
+_FORM_SUCCESS_MESSAGE = 'Form submitted successfully! Welcome, %s!'
 
-    context = {
-        'title': 'Navigation Components',
-        'description': 'Navbar, Sidebar, and Dashboard Layout components',
-        'page_title': 'Navigation Components',
-        'page_description': 'Interactive demo of Navbar, Sidebar, and Dashboard Layout',
-        'nav_items': nav_items,
-        'user_menu': user_menu,
-        'user_name': 'John Doe',
-        'sidebar_items': sidebar_items,
-        'site_name': 'Adalex UI Demo',
-    }
-    return render(request, 'demo/navigation_demo.html', context)
 
+@lru_cache(maxsize=1)
+def _form_demo_url():
+    """
+    Resolve the form demo URL once; the URLconf is fixed at runtime.
 
+    Returns:
+        str: Path of the form demo page
+    """
+    return reverse('demo:form_demo')
+
+
+@require_http_methods(["GET", "POST"])
 def form_demo(request):
     """
     Demo view for Form component with full form submission handling.
@@ -175,176 +444,34 @@ def form_demo(request):
         message = request.POST.get('message', '')
 
         # In a real application, you would process the data here
-        # For demo purposes, we'll just show a success message
-        messages.success(
-            request,
-            f'Form submitted successfully! Welcome, {name}!'
-        )
+        # For demo purposes, the success state travels in the query string
+        # instead of the session-backed messages framework
 
         # Redirect to prevent form resubmission
-        return redirect('form_demo')
-
-    # Prepare form fields configuration
-    contact_form_fields = [
-        {
-            'type': 'text',
-            'name': 'full_name',
-            'label': 'Full Name',
-            'placeholder': 'Enter your full name',
-            'required': True,
-        },
-        {
-            'type': 'email',
-            'name': 'email',
-            'label': 'Email Address',
-            'placeholder': 'your.email@example.com',
-            'required': True,
-        },
-        {
-            'type': 'select',
-            'name': 'country',
-            'label': 'Country',
-            'required': True,
-            'placeholder': 'Select a country...',
-            'options': [
-                {'value': 'tr', 'label': 'Turkey'},
-                {'value': 'us', 'label': 'United States'},
-                {'value': 'uk', 'label': 'United Kingdom'},
-                {'value': 'de', 'label': 'Germany'},
-                {'value': 'fr', 'label': 'France'},
-            ],
-        },
-        {
-            'type': 'textarea',
-            'name': 'message',
-            'label': 'Message',
-            'placeholder': 'Type your message here...',
-            'required': False,
-            'rows': 5,
-        },
-    ]
-
-    # Compact registration form
-    registration_form_fields = [
-        {
-            'type': 'text',
-            'name': 'username',
-            'label': 'Username',
-            'placeholder': 'Choose a username',
-            'required': True,
-        },
-        {
-            'type': 'password',
-            'name': 'password',
-            'label': 'Password',
-            'placeholder': 'Enter a secure password',
-            'required': True,
-        },
-        {
-            'type': 'password',
-            'name': 'password_confirm',
-            'label': 'Confirm Password',
-            'placeholder': 'Re-enter your password',
-            'required': True,
-        },
-    ]
-    
-    # Profile form with various field types
-    profile_form_fields = [
-        {
-            'type': 'text',
-            'name': 'name',
-            'label': 'Full Name',
-            'value': 'John Doe',
-            'required': True,
-        },
-        {
-            'type': 'email',
-            'name': 'email',
-            'label': 'Email',
-            'value': 'john@example.com',
-            'required': True,
-        },
-        {
-            'type': 'tel',
-            'name': 'phone',
-            'label': 'Phone Number',
-            'placeholder': '+90 555 123 4567',
-        },
-        {
-            'type': 'url',
-            'name': 'website',
-            'label': 'Website',
-            'placeholder': 'https://yourwebsite.com',
-        },
-        {
-            'type': 'number',
-            'name': 'age',
-            'label': 'Age',
-            'min': 18,
-            'max': 120,
-            'value': 25,
-        },
-        {
-            'type': 'textarea',
-            'name': 'bio',
-            'label': 'Bio',
-            'placeholder': 'Tell us about yourself...',
-            'rows': 3,
-        },
-    ]
-    
-    # Survey form with radio and checkbox
-    survey_form_fields = [
-        {
-            'type': 'radio',
-            'name': 'experience',
-            'label': 'How would you rate your experience?',
-            'required': True,
-            'options': [
-                {'value': 'excellent', 'label': 'Excellent'},
-                {'value': 'good', 'label': 'Good'},
-                {'value': 'average', 'label': 'Average'},
-                {'value': 'poor', 'label': 'Poor'},
-            ],
-        },
-        {
-            'type': 'checkbox',
-            'name': 'newsletter',
-            'label': 'Subscribe to newsletter',
-            'help_text': 'I want to receive updates and promotions',
-        },
-        {
-            'type': 'select',
-            'name': 'frequency',
-            'label': 'Preferred contact frequency',
-            'placeholder': 'Choose frequency...',
-            'options': [
-                {'value': 'daily', 'label': 'Daily'},
-                {'value': 'weekly', 'label': 'Weekly'},
-                {'value': 'monthly', 'label': 'Monthly'},
-            ],
-        },
-        {
-            'type': 'textarea',
-            'name': 'comments',
-            'label': 'Additional Comments',
-            'placeholder': 'Any suggestions?',
-            'rows': 4,
-        },
-    ]
+        query_string = urlencode({'submitted': 1, 'name': name})
+        return HttpResponseRedirect(f"{_form_demo_url()}?{query_string}")
 
     context = {
         'title': 'Form Component',
         'description': 'Complete form container with validation and feedback',
-        'contact_form_fields': contact_form_fields,
-        'registration_form_fields': registration_form_fields,
-        'profile_form_fields': profile_form_fields,
-        'survey_form_fields': survey_form_fields,
+        'contact_form_fields': _CONTACT_FORM_FIELDS,
+        'registration_form_fields': _REGISTRATION_FORM_FIELDS,
+        'profile_form_fields': _PROFILE_FORM_FIELDS,
+        'survey_form_fields': _SURVEY_FORM_FIELDS,
     }
+    if request.GET.get('submitted'):
+        context['success_message'] = _FORM_SUCCESS_MESSAGE % request.GET.get('name', '')
     return render(request, 'demo/form_demo.html', context)
 
 
+_FORMS_ADVANCED_CONTEXT = {
+    'title': 'Advanced Form Components',
+    'description': 'Checkbox, Radio, Switch, and Datepicker components',
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def forms_advanced(request):
     """
     Demo view for advanced form components (checkbox, radio, switch, datepicker).
@@ -355,152 +482,274 @@ def forms_advanced(request):
     Returns:
         Rendered template showcasing advanced form components
     """
-    context = {
-        'title': 'Advanced Form Components',
-        'description': 'Checkbox, Radio, Switch, and Datepicker components',
-    }
-    return render(request, 'demo/forms_advanced.html', context)
+    return render(request, 'demo/forms_advanced.html', _FORMS_ADVANCED_CONTEXT)
 
 
-def table_demo(request):
+# Define row actions
+_TABLE_ROW_ACTIONS = _freeze([
+    {
+        'url_pattern': '/demo/table/view/{id}/',
+        'text': 'View',
+        'variant': 'secondary',
+    },
+    {
+        'url_pattern': '/demo/table/edit/{id}/',
+        'text': 'Edit',
+        'variant': 'primary',
+    },
+])
+
+
+def _build_all_records(row_actions):
     """
-    Demo view for Table component with search, sorting, and pagination.
+    Generate the static dummy dataset for the table demo (100 records).
+
+    Dates are relative to a fixed base date so the dataset never changes
+    and can be built once at import. Each record's action URLs are resolved
+    here too, so the demo row partial links to them directly instead of
+    formatting url_pattern per row on every render.
 
     Args:
-        request: Django HTTP request object
+        row_actions: Row action dicts with 'url_pattern', 'text' and optional
+            'variant' and 'method'
 
     Returns:
-        Rendered template showcasing Table component
+        tuple: Record dicts with id, name, email, department, status, joined,
+            score and action_links
     """
-    import math
-    from datetime import datetime, timedelta
-
-    # Generate dummy data (100 records)
-    all_records = []
     statuses = ['Active', 'Pending', 'Inactive', 'Completed']
     departments = ['Engineering', 'Sales', 'Marketing', 'Support', 'HR']
+    base_date = datetime(2024, 1, 1)
 
-    for i in range(1, 101):
-        all_records.append({
+    # Record i takes the (i % len)-th entry; ids start at 1, so rotate by one
+    department_cycle = cycle(departments[1:] + departments[:1])
+    status_cycle = cycle(statuses[1:] + statuses[:1])
+
+    records = []
+    for i, department, status in zip(range(1, 101), department_cycle, status_cycle):
+        record = {
             'id': i,
             'name': f'User {i:03d}',
             'email': f'user{i:03d}@example.com',
-            'department': departments[i % len(departments)],
-            'status': statuses[i % len(statuses)],
-            'joined': (datetime.now() - timedelta(days=i * 10)).strftime('%Y-%m-%d'),
+            'department': department,
+            'status': status,
+            'joined': (base_date - timedelta(days=i * 10)).strftime('%Y-%m-%d'),
             'score': 50 + (i * 7) % 51,  # Random score between 50-100
-        })
-
-    # Get query parameters
-    search_query = request.GET.get('search', '').strip()
-    sort_key = request.GET.get('sort', '')
-    sort_direction = request.GET.get('direction', 'asc')
-    page = int(request.GET.get('page', 1))
-    page_size = 10
-
-    # Filter records based on search
-    filtered_records = all_records
-    if search_query:
-        filtered_records = [
-            record for record in all_records
-            if (search_query.lower() in record['name'].lower() or
-                search_query.lower() in record['email'].lower() or
-                search_query.lower() in record['department'].lower() or
-                search_query.lower() in record['status'].lower())
-        ]
-
-    # Sort records
-    if sort_key and sort_key in ['id', 'name', 'email', 'department', 'status', 'joined', 'score']:
-        reverse = (sort_direction == 'desc')
-        filtered_records = sorted(
-            filtered_records,
-            key=lambda x: x[sort_key],
-            reverse=reverse
+        }
+        record['action_links'] = tuple(
+            MappingProxyType({
+                'url': action['url_pattern'].format(**record),
+                'text': action['text'],
+                'variant': action.get('variant', 'secondary'),
+                'method': action.get('method', 'get'),
+            })
+            for action in row_actions
         )
+        records.append(record)
+    return tuple(records)
+
+
+# Table demo dataset, shared read-only across requests
+_ALL_RECORDS = _build_all_records(_TABLE_ROW_ACTIONS)
+
+# Lowercased searchable fields per record (parallel to _ALL_RECORDS); the
+# newline separator keeps a query from matching across two fields
+_RECORD_SEARCH_BLOBS = tuple(
+    f"{record['name']}\n{record['email']}\n{record['department']}\n{record['status']}".lower()
+    for record in _ALL_RECORDS
+)
+
+
+def _trigrams(text):
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _build_trigram_index(blobs):
+    """
+    Build an inverted index from trigram to the positions of the blobs containing it.
+
+    Args:
+        blobs: Sequence of lowercased search strings
+
+    Returns:
+        dict: Trigram -> frozenset of indexes into blobs
+    """
+    index = {}
+    for position, blob in enumerate(blobs):
+        for trigram in _trigrams(blob):
+            index.setdefault(trigram, set()).add(position)
+    return {trigram: frozenset(positions) for trigram, positions in index.items()}
+
+
+_TRIGRAM_INDEX = _build_trigram_index(_RECORD_SEARCH_BLOBS)
 
-    # Calculate pagination
-    total_records = len(filtered_records)
-    total_pages = math.ceil(total_records / page_size) if total_records > 0 else 1
-    page = max(1, min(page, total_pages))  # Ensure page is within range
-
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_records = filtered_records[start_idx:end_idx]
-
-    # Build pagination data
-    def build_page_url(page_num):
-        from urllib.parse import urlencode
-        params = {}
-        if search_query:
-            params['search'] = search_query
-        if sort_key:
-            params['sort'] = sort_key
-            params['direction'] = sort_direction
-        params['page'] = page_num
-        return f'/demo/table/?{urlencode(params)}'
-
-    pagination_data = build_pagination_data(
-        page,
-        total_pages,
-        '/demo/table/?page={page}'
+
+# Sortable table_demo columns and every (key, descending) ordering of the dataset
+_SORT_KEYS = ('id', 'name', 'email', 'department', 'status', 'joined', 'score')
+
+_SORTED_RECORDS = {
+    (key, descending): tuple(sorted(_ALL_RECORDS, key=itemgetter(key), reverse=descending))
+    for key in _SORT_KEYS
+    for descending in (False, True)
+}
+
+
+def _search_record_positions(query):
+    """
+    Find the positions of records whose searchable fields contain query.
+
+    Queries of three or more characters intersect the trigram posting lists
+    and verify each candidate with a substring check; shorter queries fall
+    back to a linear scan.
+
+    Args:
+        query: Lowercased search string
+
+    Returns:
+        list: Matching indexes into _ALL_RECORDS in ascending order
+    """
+    if len(query) < 3:
+        return [position for position, blob in enumerate(_RECORD_SEARCH_BLOBS) if query in blob]
+
+    postings = sorted(
+        (_TRIGRAM_INDEX.get(trigram, frozenset()) for trigram in _trigrams(query)),
+        key=len,
     )
+    candidates = postings[0].intersection(*postings[1:])
+    return [position for position in sorted(candidates) if query in _RECORD_SEARCH_BLOBS[position]]
 
-    # Update URLs with search and sort parameters
-    for page_info in pagination_data['pages']:
-        if not page_info.get('is_ellipsis'):
-            page_info['url'] = build_page_url(page_info['number'])
-
-    if pagination_data['prev_url']:
-        pagination_data['prev_url'] = build_page_url(page - 1)
-    if pagination_data['next_url']:
-        pagination_data['next_url'] = build_page_url(page + 1)
-
-    # Define table columns
-    columns = [
-        {'key': 'id', 'label': 'ID', 'sortable': True},
-        {'key': 'name', 'label': 'Name', 'sortable': True},
-        {'key': 'email', 'label': 'Email', 'sortable': True},
-        {'key': 'department', 'label': 'Department', 'sortable': True},
-        {'key': 'status', 'label': 'Status', 'sortable': True},
-        {'key': 'joined', 'label': 'Joined', 'sortable': True},
-        {'key': 'score', 'label': 'Score', 'sortable': True},
-    ]
 
-    # Define row actions
-    row_actions = [
-        {
-            'url_pattern': '/demo/table/view/{id}/',
-            'text': 'View',
-            'variant': 'secondary',
-        },
-        {
-            'url_pattern': '/demo/table/edit/{id}/',
-            'text': 'Edit',
-            'variant': 'primary',
-        },
-    ]
+def _search_records(query):
+    """
+    Search _ALL_RECORDS through the trigram index.
+
+    The index holds positions into _ALL_RECORDS, so the dataset is fixed here
+    rather than taken as an argument.
 
+    Args:
+        query (str): Search text
+
+    Returns:
+        list: Matching records in dataset order
+    """
+    return [_ALL_RECORDS[position] for position in _search_record_positions(query.lower())]
+
+
+def _sort_records(records, key, descending):
+    """
+    Sort demo records, reusing the precomputed ordering for the full dataset.
+
+    Args:
+        records: Demo records, possibly narrowed by a search
+        key (str): Column key to sort by
+        descending (bool): Sort in descending order
+
+    Returns:
+        Sequence of records in the requested order
+    """
+    if records is _ALL_RECORDS:
+        return _SORTED_RECORDS[(key, descending)]
+    return sorted(records, key=itemgetter(key), reverse=descending)
+
+
+# Define table columns
+_TABLE_COLUMNS = _freeze([
+    {'key': 'id', 'label': 'ID', 'sortable': True},
+    {'key': 'name', 'label': 'Name', 'sortable': True},
+    {'key': 'email', 'label': 'Email', 'sortable': True},
+    {'key': 'department', 'label': 'Department', 'sortable': True},
+    {'key': 'status', 'label': 'Status', 'sortable': True},
+    {'key': 'joined', 'label': 'Joined', 'sortable': True},
+    {'key': 'score', 'label': 'Score', 'sortable': True},
+])
+
+
+@require_safe
+@_page_cache(60 * 60, key_prefix='table_demo')
+def table_demo(request):
+    """
+    Demo view for Table component with search, sorting, and pagination.
+
+    Args:
+        request: Django HTTP request object
+
+    Returns:
+        Rendered template showcasing Table component
+    """
     context = {
         'title': 'Table Component',
         'description': 'Data table with search, sorting, and pagination',
-        'columns': columns,
-        'rows': paginated_records,
-        'row_actions': row_actions,
+        'row_actions': _TABLE_ROW_ACTIONS,
+        'row_partial': 'demo/table_row.html',
         'searchable': True,
         'sortable': True,
         'paginated': True,
-        'search_query': search_query,
-        'sort_key': sort_key,
-        'sort_direction': sort_direction,
-        'pagination_data': pagination_data,
-        'current_page': page,
-        'total_pages': total_pages,
-        'total_records': total_records,
+        **build_table_context(
+            _ALL_RECORDS,
+            _TABLE_COLUMNS,
+            request,
+            base_url='/demo/table/',
+            filter_rows=lambda rows, query: _search_records(query),
+            sort_rows=_sort_records,
+        ),
     }
 
     return render(request, 'demo/table_demo.html', context)
 
 
+# Tabs data
+_TABS_DATA = _freeze([
+    {
+        'id': 'overview',
+        'label': 'Overview',
+        'content': '<p>This is the overview panel. Here you can see a summary of your dashboard with key metrics and recent activity.</p>'
+    },
+    {
+        'id': 'details',
+        'label': 'Details',
+        'content': '<p>Detailed information about your account, settings, and preferences. You can customize various options here.</p>'
+    },
+    {
+        'id': 'settings',
+        'label': 'Settings',
+        'content': '<p>Configure your application settings, notifications, and privacy options in this panel.</p>'
+    },
+])
+
+_TABS_WITH_ICONS = _freeze([
+    {
+        'id': 'home',
+        'label': 'Home',
+        'icon': 'star',
+        'content': '<p>Welcome to your home dashboard. Quick access to all your important features.</p>'
+    },
+    {
+        'id': 'profile',
+        'label': 'Profile',
+        'icon': 'user',
+        'content': '<p>Manage your profile information, avatar, and public settings.</p>'
+    },
+    {
+        'id': 'notifications',
+        'label': 'Notifications',
+        'icon': 'info',
+        'badge': '3',
+        'content': '<p>You have 3 new notifications. Review and manage your notification preferences.</p>'
+    },
+])
+
+
+_COMPONENTS_COMPLEX_CONTEXT = {
+    'title': 'Complex Components',
+    'description': 'Card, Notification/Toast, and Tabs components',
+    'tabs_data': _TABS_DATA,
+    'tabs_with_icons': _TABS_WITH_ICONS,
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def components_complex(request):
     """
     Demo view for complex components (Card, Notification, Tabs).
@@ -511,56 +760,16 @@ def components_complex(request):
     Returns:
         Rendered template showcasing complex components
     """
-    # Tabs data
-    tabs_data = [
-        {
-            'id': 'overview',
-            'label': 'Overview',
-            'content': '<p>This is the overview panel. Here you can see a summary of your dashboard with key metrics and recent activity.</p>'
-        },
-        {
-            'id': 'details',
-            'label': 'Details',
-            'content': '<p>Detailed information about your account, settings, and preferences. You can customize various options here.</p>'
-        },
-        {
-            'id': 'settings',
-            'label': 'Settings',
-            'content': '<p>Configure your application settings, notifications, and privacy options in this panel.</p>'
-        },
-    ]
+    return render(request, 'demo/components_complex.html', _COMPONENTS_COMPLEX_CONTEXT)
 
-    tabs_with_icons = [
-        {
-            'id': 'home',
-            'label': 'Home',
-            'icon': 'star',
-            'content': '<p>Welcome to your home dashboard. Quick access to all your important features.</p>'
-        },
-        {
-            'id': 'profile',
-            'label': 'Profile',
-            'icon': 'user',
-            'content': '<p>Manage your profile information, avatar, and public settings.</p>'
-        },
-        {
-            'id': 'notifications',
-            'label': 'Notifications',
-            'icon': 'info',
-            'badge': '3',
-            'content': '<p>You have 3 new notifications. Review and manage your notification preferences.</p>'
-        },
-    ]
 
-    context = {
-        'title': 'Complex Components',
-        'description': 'Card, Notification/Toast, and Tabs components',
-        'tabs_data': tabs_data,
-        'tabs_with_icons': tabs_with_icons,
-    }
-    return render(request, 'demo/components_complex.html', context)
+_AUTH_CONTEXT = {
+    'title': 'Authentication Components',
+    'description': 'Login and Register form components with password visibility toggle',
+}
 
 
+@require_http_methods(["GET", "POST"])
 def auth_demo(request):
     """
     Demo view for authentication components (Login Form, Register Form).
@@ -571,13 +780,17 @@ def auth_demo(request):
     Returns:
         Rendered template showcasing auth components
     """
-    context = {
-        'title': 'Authentication Components',
-        'description': 'Login and Register form components with password visibility toggle',
-    }
-    return render(request, 'demo/auth_demo.html', context)
+    return render(request, 'demo/auth_demo.html', _AUTH_CONTEXT)
 
 
+_DIALOGS_CONTEXT = {
+    'title': 'Dialog Components',
+    'description': 'Confirm Dialog and Drawer components with focus trap and keyboard support',
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def dialogs_demo(request):
     """
     Demo view for dialog components (Confirm Dialog, Drawer).
@@ -588,13 +801,69 @@ def dialogs_demo(request):
     Returns:
         Rendered template showcasing dialog components
     """
-    context = {
-        'title': 'Dialog Components',
-        'description': 'Confirm Dialog and Drawer components with focus trap and keyboard support',
-    }
-    return render(request, 'demo/dialogs_demo.html', context)
-
-
+    return render(request, 'demo/dialogs_demo.html', _DIALOGS_CONTEXT)
+
+
+# Sample user profile data
+_USER_FIELDS = _freeze([
+    {'label': 'Name', 'value': 'John Doe'},
+    {'label': 'Email', 'value': 'john.doe@example.com', 'icon': 'mail'},
+    {'label': 'Phone', 'value': '+1 (555) 123-4567', 'icon': 'phone'},
+    {'label': 'Department', 'value': 'Engineering'},
+    {'label': 'Status', 'value': 'Active', 'badge': True, 'badge_variant': 'success'},
+    {'label': 'Role', 'value': 'Senior Developer', 'highlight': True},
+    {'label': 'Location', 'value': 'New York, USA', 'icon': 'location'},
+    {'label': 'Joined', 'value': 'January 15, 2023'},
+])
+
+# Sample product data
+_PRODUCT_FIELDS = _freeze([
+    {'label': 'Product ID', 'value': 'PRD-2024-001'},
+    {'label': 'Name', 'value': 'Premium Laptop Pro'},
+    {'label': 'Category', 'value': 'Electronics / Computers'},
+    {'label': 'Price', 'value': '$1,299.99', 'variant': 'success'},
+    {'label': 'Stock', 'value': 'In Stock', 'badge': True, 'badge_variant': 'info'},
+    {'label': 'Rating', 'value': '4.5/5.0 (234 reviews)', 'icon': 'star'},
+    {'label': 'Manufacturer', 'value': 'TechCorp Inc.'},
+    {'label': 'Warranty', 'value': '2 Years', 'highlight': True},
+])
+
+# Sample order data
+_ORDER_FIELDS = _freeze([
+    {'label': 'Order Number', 'value': '#ORD-2024-5678'},
+    {'label': 'Customer', 'value': 'Alice Johnson'},
+    {'label': 'Date', 'value': 'November 27, 2024'},
+    {'label': 'Total', 'value': '$2,456.78', 'variant': 'info', 'highlight': True},
+    {'label': 'Payment', 'value': 'Paid', 'badge': True, 'badge_variant': 'success'},
+    {'label': 'Shipping', 'value': 'Delivered', 'badge': True, 'badge_variant': 'success'},
+    {'label': 'Tracking', 'value': 'TRK123456789', 'icon': 'package'},
+])
+
+# Actions for detail views
+_USER_ACTIONS = _freeze([
+    {'text': 'Edit Profile', 'variant': 'primary', 'href': '#'},
+    {'text': 'Send Message', 'variant': 'secondary', 'href': '#'},
+])
+
+_PRODUCT_ACTIONS = _freeze([
+    {'text': 'Edit', 'variant': 'primary', 'href': '#'},
+    {'text': 'Delete', 'variant': 'error', 'href': '#'},
+])
+
+
+_DETAIL_CONTEXT = {
+    'title': 'Detail View Component',
+    'description': 'Label-value grid layout for displaying detailed information',
+    'user_fields': _USER_FIELDS,
+    'product_fields': _PRODUCT_FIELDS,
+    'order_fields': _ORDER_FIELDS,
+    'user_actions': _USER_ACTIONS,
+    'product_actions': _PRODUCT_ACTIONS,
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def detail_demo(request):
     """
     Demo view for Detail View component.
@@ -605,64 +874,17 @@ def detail_demo(request):
     Returns:
         Rendered template showcasing Detail View component
     """
-    # Sample user profile data
-    user_fields = [
-        {'label': 'Name', 'value': 'John Doe'},
-        {'label': 'Email', 'value': 'john.doe@example.com', 'icon': 'mail'},
-        {'label': 'Phone', 'value': '+1 (555) 123-4567', 'icon': 'phone'},
-        {'label': 'Department', 'value': 'Engineering'},
-        {'label': 'Status', 'value': 'Active', 'badge': True, 'badge_variant': 'success'},
-        {'label': 'Role', 'value': 'Senior Developer', 'highlight': True},
-        {'label': 'Location', 'value': 'New York, USA', 'icon': 'location'},
-        {'label': 'Joined', 'value': 'January 15, 2023'},
-    ]
-    
-    # Sample product data
-    product_fields = [
-        {'label': 'Product ID', 'value': 'PRD-2024-001'},
-        {'label': 'Name', 'value': 'Premium Laptop Pro'},
-        {'label': 'Category', 'value': 'Electronics / Computers'},
-        {'label': 'Price', 'value': '$1,299.99', 'variant': 'success'},
-        {'label': 'Stock', 'value': 'In Stock', 'badge': True, 'badge_variant': 'info'},
-        {'label': 'Rating', 'value': '4.5/5.0 (234 reviews)', 'icon': 'star'},
-        {'label': 'Manufacturer', 'value': 'TechCorp Inc.'},
-        {'label': 'Warranty', 'value': '2 Years', 'highlight': True},
-    ]
-    
-    # Sample order data
-    order_fields = [
-        {'label': 'Order Number', 'value': '#ORD-2024-5678'},
-        {'label': 'Customer', 'value': 'Alice Johnson'},
-        {'label': 'Date', 'value': 'November 27, 2024'},
-        {'label': 'Total', 'value': '$2,456.78', 'variant': 'info', 'highlight': True},
-        {'label': 'Payment', 'value': 'Paid', 'badge': True, 'badge_variant': 'success'},
-        {'label': 'Shipping', 'value': 'Delivered', 'badge': True, 'badge_variant': 'success'},
-        {'label': 'Tracking', 'value': 'TRK123456789', 'icon': 'package'},
-    ]
-    
-    # Actions for detail views
-    user_actions = [
-        {'text': 'Edit Profile', 'variant': 'primary', 'href': '#'},
-        {'text': 'Send Message', 'variant': 'secondary', 'href': '#'},
-    ]
-    
-    product_actions = [
-        {'text': 'Edit', 'variant': 'primary', 'href': '#'},
-        {'text': 'Delete', 'variant': 'error', 'href': '#'},
-    ]
-    
-    context = {
-        'title': 'Detail View Component',
-        'description': 'Label-value grid layout for displaying detailed information',
-        'user_fields': user_fields,
-        'product_fields': product_fields,
-        'order_fields': order_fields,
-        'user_actions': user_actions,
-        'product_actions': product_actions,
-    }
-    return render(request, 'demo/detail_demo.html', context)
+    return render(request, 'demo/detail_demo.html', _DETAIL_CONTEXT)
 
 
+_UPLOAD_CONTEXT = {
+    'title': 'File Upload Component',
+    'description': 'Drag & drop file upload with validation and preview',
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def upload_demo(request):
     """
     Demo view for File Upload component.
@@ -673,36 +895,21 @@ def upload_demo(request):
     Returns:
         Rendered template showcasing File Upload component
     """
-    context = {
-        'title': 'File Upload Component',
-        'description': 'Drag & drop file upload with validation and preview',
-    }
-    return render(request, 'demo/upload_demo.html', context)
-
-
-def filter_demo(request):
-    """
-    Demo view for Filter Bar component.
-
-    Args:
-        request: Django HTTP request object
-
-    Returns:
-        Rendered template showcasing Filter Bar component
-    """
-    # Sample filters for e-commerce
-    ecommerce_filters = [
-        {
-            'type': 'search',
-            'name': 'search',
-            'placeholder': 'Search products...',
-            'value': request.GET.get('search', ''),
-        },
-        {
+    return render(request, 'demo/upload_demo.html', _UPLOAD_CONTEXT)
+
+
+# Filter bar schemas as (schema, bindings) pairs; each binding copies a query
+# parameter, or its default, into the given key of the filter dict
+_ECOMMERCE_FILTERS = (
+    (
+        _freeze({'type': 'search', 'name': 'search', 'placeholder': 'Search products...'}),
+        (('value', 'search', ''),),
+    ),
+    (
+        _freeze({
             'type': 'select',
             'name': 'category',
             'placeholder': 'All Categories',
-            'value': request.GET.get('category', ''),
             'options': [
                 {'value': '', 'label': 'All Categories'},
                 {'value': 'electronics', 'label': 'Electronics'},
@@ -710,72 +917,113 @@ def filter_demo(request):
                 {'value': 'books', 'label': 'Books'},
                 {'value': 'home', 'label': 'Home & Garden'},
             ],
-        },
-        {
-            'type': 'date_range',
-            'name': 'date',
-            'value_from': request.GET.get('date_from', ''),
-            'value_to': request.GET.get('date_to', ''),
-        },
-        {
-            'type': 'checkbox',
-            'name': 'in_stock',
-            'label': 'In Stock Only',
-            'value': request.GET.get('in_stock', ''),
-        },
-    ]
-    
-    # Sample filters for user management
-    user_filters = [
-        {
-            'type': 'text',
-            'name': 'name',
-            'placeholder': 'Filter by name...',
-            'value': request.GET.get('name', ''),
-        },
-        {
+        }),
+        (('value', 'category', ''),),
+    ),
+    (
+        _freeze({'type': 'date_range', 'name': 'date'}),
+        (('value_from', 'date_from', ''), ('value_to', 'date_to', '')),
+    ),
+    (
+        _freeze({'type': 'checkbox', 'name': 'in_stock', 'label': 'In Stock Only'}),
+        (('value', 'in_stock', ''),),
+    ),
+)
+
+_USER_FILTERS = (
+    (
+        _freeze({'type': 'text', 'name': 'name', 'placeholder': 'Filter by name...'}),
+        (('value', 'name', ''),),
+    ),
+    (
+        _freeze({
             'type': 'select',
             'name': 'role',
             'placeholder': 'All Roles',
-            'value': request.GET.get('role', ''),
             'options': [
                 {'value': '', 'label': 'All Roles'},
                 {'value': 'admin', 'label': 'Admin'},
                 {'value': 'editor', 'label': 'Editor'},
                 {'value': 'viewer', 'label': 'Viewer'},
             ],
-        },
-        {
+        }),
+        (('value', 'role', ''),),
+    ),
+    (
+        _freeze({
             'type': 'radio',
             'name': 'status',
-            'value': request.GET.get('status', 'all'),
             'options': [
                 {'value': 'all', 'label': 'All'},
                 {'value': 'active', 'label': 'Active'},
                 {'value': 'inactive', 'label': 'Inactive'},
             ],
-        },
+        }),
+        (('value', 'status', 'all'),),
+    ),
+)
+
+# Active filter chips as (query parameter, label, fixed display value or None)
+_ACTIVE_FILTER_SPECS = (
+    ('search', 'Search', None),
+    ('category', 'Category', None),
+    ('in_stock', 'Stock', 'In Stock Only'),
+)
+
+
+def _bind_filter_values(filters, query):
+    """
+    Copy each filter schema and fill in its current values from the query.
+
+    Args:
+        filters (tuple): (schema, bindings) pairs, see _ECOMMERCE_FILTERS
+        query: request.GET
+
+    Returns:
+        list: Filter dicts ready for the filter_bar component
+    """
+    return [
+        {**schema, **{key: query.get(param, default) for key, param, default in bindings}}
+        for schema, bindings in filters
     ]
-    
-    # Active filters (for display)
-    active_filters = []
-    if request.GET.get('search'):
-        active_filters.append({'label': 'Search', 'value': request.GET.get('search')})
-    if request.GET.get('category'):
-        active_filters.append({'label': 'Category', 'value': request.GET.get('category')})
-    if request.GET.get('in_stock'):
-        active_filters.append({'label': 'Stock', 'value': 'In Stock Only'})
-    
+
+
+@require_safe
+def filter_demo(request):
+    """
+    Demo view for Filter Bar component.
+
+    Args:
+        request: Django HTTP request object
+
+    Returns:
+        Rendered template showcasing Filter Bar component
+    """
+    query = request.GET
+    active_filters = [
+        {'label': label, 'value': display_value or value}
+        for param, label, display_value in _ACTIVE_FILTER_SPECS
+        if (value := query.get(param))
+    ]
+
     context = {
         'title': 'Filter Bar Component',
         'description': 'Horizontal filter form with various input types',
-        'ecommerce_filters': ecommerce_filters,
-        'user_filters': user_filters,
+        'ecommerce_filters': _bind_filter_values(_ECOMMERCE_FILTERS, query),
+        'user_filters': _bind_filter_values(_USER_FILTERS, query),
         'active_filters': active_filters,
     }
     return render(request, 'demo/filter_demo.html', context)
 
 
+_LOADING_CONTEXT = {
+    'title': 'Loading State Management',
+    'description': 'Comprehensive loading states: buttons, forms, tables, skeleton loaders, and global indicators',
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def loading_demo(request):
     """
     Demo view for Loading State Management components.
@@ -786,13 +1034,16 @@ def loading_demo(request):
     Returns:
         Rendered template showcasing loading states for buttons, forms, tables, and global indicators
     """
-    context = {
-        'title': 'Loading State Management',
-        'description': 'Comprehensive loading states: buttons, forms, tables, skeleton loaders, and global indicators',
-    }
-    return render(request, 'demo/loading_demo.html', context)
+    return render(request, 'demo/loading_demo.html', _LOADING_CONTEXT)
+
 
+_ACCESSIBILITY_CONTEXT = {
+    'title': 'Accessibility & Keyboard Navigation',
+    'description': 'Comprehensive keyboard navigation and screen reader support for all components',
+}
 
+
+@require_safe
 def accessibility_demo(request):
     """
     Demo view for Accessibility and Keyboard Navigation features.
@@ -803,13 +1054,221 @@ def accessibility_demo(request):
     Returns:
         Rendered template showcasing accessibility features and keyboard navigation
     """
-    context = {
-        'title': 'Accessibility & Keyboard Navigation',
-        'description': 'Comprehensive keyboard navigation and screen reader support for all components',
-    }
-    return render(request, 'demo/accessibility_demo.html', context)
+    return render(request, 'demo/accessibility_demo.html', _ACCESSIBILITY_CONTEXT)
+
 
+# Sample photos come from picsum.photos; a fixed seed per slot keeps each URL
+# stable, and swapping this one pattern (e.g. to static files) moves them all
+_CAROUSEL_IMAGE_URL = 'https://picsum.photos/{width}/{height}?random={seed}'
 
+
+def _carousel_items(fields, rows, image_size=None):
+    """
+    Build frozen carousel items from a field-name tuple and value rows.
+
+    Args:
+        fields (tuple): Item keys shared by every row (e.g. 'seed', 'alt', 'title')
+        rows (list): Tuples of values, one per item, in the order of fields
+        image_size (tuple): (width, height) of the images; when given, each
+            row's 'seed' value is turned into an 'image_url' via _CAROUSEL_IMAGE_URL
+
+    Returns:
+        tuple: Read-only item mappings for the carousel component
+    """
+    items = [dict(zip(fields, row)) for row in rows]
+    if image_size is not None:
+        width, height = image_size
+        for item in items:
+            item['image_url'] = _CAROUSEL_IMAGE_URL.format(
+                width=width, height=height, seed=item.pop('seed'))
+    return tuple(MappingProxyType(item) for item in items)
+
+
+# Sample image items for default carousel
+_CAROUSEL_DEFAULT_ITEMS = _carousel_items(
+    ('seed', 'alt', 'title', 'description'),
+    [
+        (1, 'Beautiful landscape', 'Explore Nature',
+         'Discover breathtaking landscapes from around the world'),
+        (2, 'Modern architecture', 'Urban Design', 'Experience modern architectural marvels'),
+        (3, 'Technology workspace', 'Innovation Hub', 'Where creativity meets technology'),
+        (4, 'Ocean view', 'Coastal Dreams', 'Relax with stunning ocean views'),
+        (5, 'Mountain peaks', 'Summit Adventures', 'Reach new heights with mountain expeditions'),
+    ],
+    image_size=(800, 400),
+)
+
+# Hero carousel items with call-to-action
+_CAROUSEL_HERO_ITEMS = _carousel_items(
+    ('seed', 'alt', 'title', 'description', 'link'),
+    [
+        (
+            11,
+            'Hero banner 1',
+            'Welcome to Adalex UI',
+            'Build beautiful Django applications with our comprehensive component library',
+            '#get-started',
+        ),
+        (
+            12,
+            'Hero banner 2',
+            'Responsive & Modern',
+            'Every component is designed to work seamlessly across all devices',
+            '#features',
+        ),
+        (
+            13,
+            'Hero banner 3',
+            'Built for Developers',
+            'Clean, semantic HTML with comprehensive documentation',
+            '#documentation',
+        ),
+    ],
+    image_size=(1200, 500),
+)
+
+# Card carousel items
+_CAROUSEL_CARD_ITEMS = _carousel_items(
+    ('seed', 'alt', 'title', 'description', 'link'),
+    [
+        (
+            21,
+            'Product 1',
+            'Premium Laptop',
+            'High-performance laptop with latest specifications for professionals',
+            '#product-1',
+        ),
+        (
+            22,
+            'Product 2',
+            'Wireless Headphones',
+            'Premium sound quality with active noise cancellation',
+            '#product-2',
+        ),
+        (
+            23,
+            'Product 3',
+            'Smart Watch',
+            'Track your fitness and stay connected on the go',
+            '#product-3',
+        ),
+        (
+            24,
+            'Product 4',
+            'Camera Pro',
+            'Capture stunning photos with professional-grade equipment',
+            '#product-4',
+        ),
+        (
+            25,
+            'Product 5',
+            'Gaming Console',
+            'Next-generation gaming experience with 4K graphics',
+            '#product-5',
+        ),
+        (
+            26,
+            'Product 6',
+            'Tablet Pro',
+            'Versatile tablet for work and entertainment',
+            '#product-6',
+        ),
+    ],
+    image_size=(400, 250),
+)
+
+# Thumbnail carousel items
+_CAROUSEL_THUMBNAIL_ITEMS = _carousel_items(
+    ('seed', 'alt', 'title'),
+    [
+        (31, 'Gallery image 1', 'Sunset'),
+        (32, 'Gallery image 2', 'City Lights'),
+        (33, 'Gallery image 3', 'Forest Path'),
+        (34, 'Gallery image 4', 'Beach View'),
+        (35, 'Gallery image 5', 'Mountain Lake'),
+        (36, 'Gallery image 6', 'Desert Dunes'),
+    ],
+    image_size=(600, 400),
+)
+
+# Text card carousel items (without images)
+_CAROUSEL_TEXT_CARD_ITEMS = _carousel_items(
+    ('title', 'description', 'metadata', 'button_text', 'link'),
+    [
+        (
+            'Customer Review',
+            '"Adalex UI has completely transformed how we build our Django applications. The components are beautifully designed and incredibly easy to integrate."',
+            'Sarah Johnson - Lead Developer',
+            'Read More',
+            '#review-1',
+        ),
+        (
+            'Performance Boost',
+            '"We reduced our development time by 40% after implementing Adalex UI. The consistent design system made our workflow much more efficient."',
+            'Mike Chen - CTO',
+            'View Case Study',
+            '#case-study-1',
+        ),
+        (
+            'Team Testimonial',
+            '"The accessibility features are outstanding. Our applications now meet WCAG 2.1 AA standards out of the box. Highly recommended!"',
+            'Alex Rodriguez - UX Designer',
+            'Learn More',
+            '#testimonial-1',
+        ),
+        (
+            'Success Story',
+            '"From prototype to production in record time. Adalex UI components helped us launch our MVP three weeks ahead of schedule."',
+            'Jessica Wang - Product Manager',
+            'View Story',
+            '#success-1',
+        ),
+        (
+            'Developer Experience',
+            '"The documentation is comprehensive and the components just work. No more fighting with CSS or wondering about browser compatibility."',
+            'David Smith - Frontend Developer',
+            'Explore Docs',
+            '#docs',
+        ),
+    ],
+)
+
+_CAROUSEL_PRELOAD_LINK = f"<{_CAROUSEL_DEFAULT_ITEMS[0]['image_url']}>; rel=preload; as=image"
+
+_CAROUSEL_CONTEXT = {
+    'title': 'Carousel Component',
+    'description': 'Interactive image carousel with multiple variants and features',
+    'default_items': _CAROUSEL_DEFAULT_ITEMS,
+    'hero_items': _CAROUSEL_HERO_ITEMS,
+    'card_items': _CAROUSEL_CARD_ITEMS,
+    'text_card_items': _CAROUSEL_TEXT_CARD_ITEMS,
+    'thumbnail_items': _CAROUSEL_THUMBNAIL_ITEMS,
+}
+
+
+_ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+
+def _render_carousel_page():
+    """
+    Render the carousel demo both plain and gzip-compressed.
+
+    Returns:
+        tuple: (html_bytes, gzipped_bytes)
+    """
+    html = render_to_string('demo/carousel_demo.html', _CAROUSEL_CONTEXT).encode('utf-8')
+    return html, gzip.compress(html, mtime=0)
+
+
+# Like _page_cache, outside DEBUG render once and reuse the bytes; under DEBUG
+# render on every call so template edits show up
+if settings.DEBUG:
+    _carousel_page = _render_carousel_page
+else:
+    _carousel_page = lru_cache(maxsize=1)(_render_carousel_page)
+
+
+@require_safe
 def carousel_demo(request):
     """
     Demo view for Carousel/Slider component.
@@ -820,196 +1279,113 @@ def carousel_demo(request):
     Returns:
         Rendered template showcasing Carousel component in all variants
     """
-    # Sample image items for default carousel
-    default_items = [
-        {
-            'image_url': 'https://picsum.photos/800/400?random=1',
-            'alt': 'Beautiful landscape',
-            'title': 'Explore Nature',
-            'description': 'Discover breathtaking landscapes from around the world',
-        },
-        {
-            'image_url': 'https://picsum.photos/800/400?random=2',
-            'alt': 'Modern architecture',
-            'title': 'Urban Design',
-            'description': 'Experience modern architectural marvels',
-        },
-        {
-            'image_url': 'https://picsum.photos/800/400?random=3',
-            'alt': 'Technology workspace',
-            'title': 'Innovation Hub',
-            'description': 'Where creativity meets technology',
-        },
-        {
-            'image_url': 'https://picsum.photos/800/400?random=4',
-            'alt': 'Ocean view',
-            'title': 'Coastal Dreams',
-            'description': 'Relax with stunning ocean views',
-        },
-        {
-            'image_url': 'https://picsum.photos/800/400?random=5',
-            'alt': 'Mountain peaks',
-            'title': 'Summit Adventures',
-            'description': 'Reach new heights with mountain expeditions',
-        },
-    ]
-    
-    # Hero carousel items with call-to-action
-    hero_items = [
-        {
-            'image_url': 'https://picsum.photos/1200/500?random=11',
-            'alt': 'Hero banner 1',
-            'title': 'Welcome to Adalex UI',
-            'description': 'Build beautiful Django applications with our comprehensive component library',
-            'link': '#get-started',
-        },
-        {
-            'image_url': 'https://picsum.photos/1200/500?random=12',
-            'alt': 'Hero banner 2',
-            'title': 'Responsive & Modern',
-            'description': 'Every component is designed to work seamlessly across all devices',
-            'link': '#features',
-        },
-        {
-            'image_url': 'https://picsum.photos/1200/500?random=13',
-            'alt': 'Hero banner 3',
-            'title': 'Built for Developers',
-            'description': 'Clean, semantic HTML with comprehensive documentation',
-            'link': '#documentation',
-        },
-    ]
-    
-    # Card carousel items
-    card_items = [
-        {
-            'image_url': 'https://picsum.photos/400/250?random=21',
-            'alt': 'Product 1',
-            'title': 'Premium Laptop',
-            'description': 'High-performance laptop with latest specifications for professionals',
-            'link': '#product-1',
-        },
-        {
-            'image_url': 'https://picsum.photos/400/250?random=22',
-            'alt': 'Product 2',
-            'title': 'Wireless Headphones',
-            'description': 'Premium sound quality with active noise cancellation',
-            'link': '#product-2',
-        },
-        {
-            'image_url': 'https://picsum.photos/400/250?random=23',
-            'alt': 'Product 3',
-            'title': 'Smart Watch',
-            'description': 'Track your fitness and stay connected on the go',
-            'link': '#product-3',
-        },
-        {
-            'image_url': 'https://picsum.photos/400/250?random=24',
-            'alt': 'Product 4',
-            'title': 'Camera Pro',
-            'description': 'Capture stunning photos with professional-grade equipment',
-            'link': '#product-4',
-        },
-        {
-            'image_url': 'https://picsum.photos/400/250?random=25',
-            'alt': 'Product 5',
-            'title': 'Gaming Console',
-            'description': 'Next-generation gaming experience with 4K graphics',
-            'link': '#product-5',
-        },
-        {
-            'image_url': 'https://picsum.photos/400/250?random=26',
-            'alt': 'Product 6',
-            'title': 'Tablet Pro',
-            'description': 'Versatile tablet for work and entertainment',
-            'link': '#product-6',
-        },
-    ]
-    
-    # Thumbnail carousel items
-    thumbnail_items = [
-        {
-            'image_url': 'https://picsum.photos/600/400?random=31',
-            'alt': 'Gallery image 1',
-            'title': 'Sunset',
-        },
-        {
-            'image_url': 'https://picsum.photos/600/400?random=32',
-            'alt': 'Gallery image 2',
-            'title': 'City Lights',
-        },
-        {
-            'image_url': 'https://picsum.photos/600/400?random=33',
-            'alt': 'Gallery image 3',
-            'title': 'Forest Path',
-        },
-        {
-            'image_url': 'https://picsum.photos/600/400?random=34',
-            'alt': 'Gallery image 4',
-            'title': 'Beach View',
-        },
-        {
-            'image_url': 'https://picsum.photos/600/400?random=35',
-            'alt': 'Gallery image 5',
-            'title': 'Mountain Lake',
-        },
-        {
-            'image_url': 'https://picsum.photos/600/400?random=36',
-            'alt': 'Gallery image 6',
-            'title': 'Desert Dunes',
-        },
-    ]
-    
-    # Text card carousel items (without images)
-    text_card_items = [
-        {
-            'title': 'Customer Review',
-            'description': '"Adalex UI has completely transformed how we build our Django applications. The components are beautifully designed and incredibly easy to integrate."',
-            'metadata': 'Sarah Johnson - Lead Developer',
-            'button_text': 'Read More',
-            'link': '#review-1',
-        },
-        {
-            'title': 'Performance Boost',
-            'description': '"We reduced our development time by 40% after implementing Adalex UI. The consistent design system made our workflow much more efficient."',
-            'metadata': 'Mike Chen - CTO',
-            'button_text': 'View Case Study',
-            'link': '#case-study-1',
-        },
-        {
-            'title': 'Team Testimonial',
-            'description': '"The accessibility features are outstanding. Our applications now meet WCAG 2.1 AA standards out of the box. Highly recommended!"',
-            'metadata': 'Alex Rodriguez - UX Designer',
-            'button_text': 'Learn More',
-            'link': '#testimonial-1',
-        },
-        {
-            'title': 'Success Story',
-            'description': '"From prototype to production in record time. Adalex UI components helped us launch our MVP three weeks ahead of schedule."',
-            'metadata': 'Jessica Wang - Product Manager',
-            'button_text': 'View Story',
-            'link': '#success-1',
-        },
-        {
-            'title': 'Developer Experience',
-            'description': '"The documentation is comprehensive and the components just work. No more fighting with CSS or wondering about browser compatibility."',
-            'metadata': 'David Smith - Frontend Developer',
-            'button_text': 'Explore Docs',
-            'link': '#docs',
-        },
-    ]
-    
-    context = {
-        'title': 'Carousel Component',
-        'description': 'Interactive image carousel with multiple variants and features',
-        'default_items': default_items,
-        'hero_items': hero_items,
-        'card_items': card_items,
-        'text_card_items': text_card_items,
-        'thumbnail_items': thumbnail_items,
-    }
-    return render(request, 'demo/carousel_demo.html', context)
-
-
+    # The page is identical for every visitor, so serve bytes rendered and
+    # compressed once instead of rendering (and gzipping) per request
+    html, compressed = _carousel_page()
+    if _ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', '')):
+        response = HttpResponse(compressed)
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(html)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if not settings.DEBUG:
+        patch_response_headers(response, _STATIC_PAGE_TIMEOUT)
+    # Start fetching the first visible slide before the HTML is parsed
+    response['Link'] = _CAROUSEL_PRELOAD_LINK
+    return response
+
+
+# Breadcrumb items
+_BREADCRUMB_ITEMS = _freeze([
+    {'text': 'Home', 'url': '#'},
+    {'text': 'Products', 'url': '#'},
+    {'text': 'Electronics', 'url': '#'},
+    {'text': 'Laptops', 'active': True},
+])
+
+# Accordion items
+_ACCORDION_ITEMS = _freeze([
+    {
+        'id': 'acc-1',
+        'title': 'What is Adalex UI?',
+        'content': '<p>Adalex UI is a comprehensive Django UI component library that provides reusable, accessible components for building modern web applications.</p>',
+        'open': True,
+    },
+    {
+        'id': 'acc-2',
+        'title': 'How do I install it?',
+        'content': '<p>You can install Adalex UI via pip: <code>pip install adalex-ui</code>. Then add "adalex_ui" to your INSTALLED_APPS.</p>',
+        'icon': 'download',
+    },
+    {
+        'id': 'acc-3',
+        'title': 'Is it accessible?',
+        'content': '<p>Yes! All components are built with WCAG 2.1 AA compliance in mind, including keyboard navigation and screen reader support.</p>',
+        'icon': 'check',
+    },
+])
+
+# Dropdown items
+_DROPDOWN_ITEMS = _freeze([
+    {'text': 'Profile', 'url': '#profile', 'icon': 'user'},
+    {'text': 'Settings', 'url': '#settings', 'icon': 'settings'},
+    {'divider': True},
+    {'text': 'Help', 'url': '#help', 'icon': 'info'},
+    {'text': 'Logout', 'url': '#logout', 'icon': 'logout'},
+])
+
+# Stepper steps
+_STEPPER_STEPS = _freeze([
+    {'label': 'Cart', 'description': 'Review items', 'status': 'completed'},
+    {'label': 'Shipping', 'description': 'Enter address', 'status': 'current'},
+    {'label': 'Payment', 'description': 'Add payment', 'status': 'pending'},
+    {'label': 'Confirm', 'description': 'Place order', 'status': 'pending'},
+])
+
+# Timeline items
+_TIMELINE_ITEMS = _freeze([
+    {
+        'title': 'Order Placed',
+        'description': 'Your order #12345 has been placed successfully.',
+        'date': '2024-01-15',
+        'icon': 'check',
+        'variant': 'success',
+    },
+    {
+        'title': 'Payment Confirmed',
+        'description': 'Payment of $299.99 has been processed.',
+        'date': '2024-01-15',
+        'icon': 'star',
+        'variant': 'primary',
+    },
+    {
+        'title': 'Shipped',
+        'description': 'Your package is on its way. Tracking: TRK123456789',
+        'date': '2024-01-16',
+        'variant': 'info',
+    },
+    {
+        'title': 'Out for Delivery',
+        'description': 'Package will be delivered today.',
+        'date': '2024-01-17',
+        'variant': 'warning',
+    },
+])
+
+
+_NEW_COMPONENTS_CONTEXT = {
+    'title': 'New Components',
+    'description': 'Breadcrumb, Avatar, Progress, Accordion, Dropdown, Stepper, Tag, Timeline, Stat Card, and Empty State',
+    'breadcrumb_items': _BREADCRUMB_ITEMS,
+    'accordion_items': _ACCORDION_ITEMS,
+    'dropdown_items': _DROPDOWN_ITEMS,
+    'stepper_steps': _STEPPER_STEPS,
+    'timeline_items': _TIMELINE_ITEMS,
+}
+
+
+@require_safe
+@_page_cache(_STATIC_PAGE_TIMEOUT)
 def new_components_demo(request):
     """
     Demo view for new components (Breadcrumb, Avatar, Progress, Accordion,
@@ -1021,90 +1397,4 @@ def new_components_demo(request):
     Returns:
         Rendered template showcasing new components
     """
-    # Breadcrumb items
-    breadcrumb_items = [
-        {'text': 'Home', 'url': '#'},
-        {'text': 'Products', 'url': '#'},
-        {'text': 'Electronics', 'url': '#'},
-        {'text': 'Laptops', 'active': True},
-    ]
-
-    # Accordion items
-    accordion_items = [
-        {
-            'id': 'acc-1',
-            'title': 'What is Adalex UI?',
-            'content': '<p>Adalex UI is a comprehensive Django UI component library that provides reusable, accessible components for building modern web applications.</p>',
-            'open': True,
-        },
-        {
-            'id': 'acc-2',
-            'title': 'How do I install it?',
-            'content': '<p>You can install Adalex UI via pip: <code>pip install adalex-ui</code>. Then add "adalex_ui" to your INSTALLED_APPS.</p>',
-            'icon': 'download',
-        },
-        {
-            'id': 'acc-3',
-            'title': 'Is it accessible?',
-            'content': '<p>Yes! All components are built with WCAG 2.1 AA compliance in mind, including keyboard navigation and screen reader support.</p>',
-            'icon': 'check',
-        },
-    ]
-
-    # Dropdown items
-    dropdown_items = [
-        {'text': 'Profile', 'url': '#profile', 'icon': 'user'},
-        {'text': 'Settings', 'url': '#settings', 'icon': 'settings'},
-        {'divider': True},
-        {'text': 'Help', 'url': '#help', 'icon': 'info'},
-        {'text': 'Logout', 'url': '#logout', 'icon': 'logout'},
-    ]
-
-    # Stepper steps
-    stepper_steps = [
-        {'label': 'Cart', 'description': 'Review items', 'status': 'completed'},
-        {'label': 'Shipping', 'description': 'Enter address', 'status': 'current'},
-        {'label': 'Payment', 'description': 'Add payment', 'status': 'pending'},
-        {'label': 'Confirm', 'description': 'Place order', 'status': 'pending'},
-    ]
-
-    # Timeline items
-    timeline_items = [
-        {
-            'title': 'Order Placed',
-            'description': 'Your order #12345 has been placed successfully.',
-            'date': '2024-01-15',
-            'icon': 'check',
-            'variant': 'success',
-        },
-        {
-            'title': 'Payment Confirmed',
-            'description': 'Payment of $299.99 has been processed.',
-            'date': '2024-01-15',
-            'icon': 'star',
-            'variant': 'primary',
-        },
-        {
-            'title': 'Shipped',
-            'description': 'Your package is on its way. Tracking: TRK123456789',
-            'date': '2024-01-16',
-            'variant': 'info',
-        },
-        {
-            'title': 'Out for Delivery',
-            'description': 'Package will be delivered today.',
-            'date': '2024-01-17',
-            'variant': 'warning',
-        },
-    ]
-
-    context = {
-        'title': 'New Components',
-        'description': 'Breadcrumb, Avatar, Progress, Accordion, Dropdown, Stepper, Tag, Timeline, Stat Card, and Empty State',
-        'breadcrumb_items': breadcrumb_items,
-        'accordion_items': accordion_items,
-        'dropdown_items': dropdown_items,
-        'stepper_steps': stepper_steps,
-        'timeline_items': timeline_items,
-    }
-    return render(request, 'demo/new_components_demo.html', context)
+    return render(request, 'demo/new_components_demo.html', _NEW_COMPONENTS_CONTEXT)
@@ -0,0 +1,38 @@
+"""cProfile middleware for ad-hoc profiling of playground requests"""
+
+import cProfile
+import io
+import pstats
+
+from django.conf import settings
+from django.http import HttpResponse
+
+
+class ProfileMiddleware:
+    """
+    Profile a request when ``?prof`` is in the query string (DEBUG only).
+
+    The response is replaced by the pstats report. Use ``prof_sort`` to pick
+    the sort order (default ``cumulative``) and ``prof_limit`` to change the
+    number of rows, e.g. ``/table/?search=user&prof&prof_sort=tottime``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DEBUG or 'prof' not in request.GET:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        profiler.runcall(self.get_response, request)
+
+        raw_limit = request.GET.get('prof_limit', '40')
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        try:
+            stats.sort_stats(request.GET.get('prof_sort', 'cumulative'))
+        except KeyError:
+            stats.sort_stats('cumulative')
+        stats.print_stats(int(raw_limit) if raw_limit.isdecimal() else 40)
+        return HttpResponse(output.getvalue(), content_type='text/plain; charset=utf-8')
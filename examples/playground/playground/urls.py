@@ -1,5 +1,6 @@
 """URL configuration for playground project"""
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
@@ -7,3 +8,6 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('demo.urls')),
 ]
+
+if 'debug_toolbar' in settings.INSTALLED_APPS:
+    urlpatterns.append(path('__debug__/', include('debug_toolbar.urls')))
@@ -0,0 +1,153 @@
+"""Tests for adalex_ui.tables.build_table_context"""
+
+from operator import attrgetter
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from adalex_ui.tables import build_table_context
+
+from .models import Member, Note, Team
+
+COLUMNS = [
+    {'key': 'name', 'sortable': True},
+    {'key': 'email'},
+    {'key': 'team', 'sortable': True},
+    {'key': 'display_name', 'sortable': True},
+]
+
+
+@pytest.fixture
+def members(db):
+    teams = [Team.objects.create(name=name) for name in ('Blue', 'Red')]
+    return [
+        Member.objects.create(name=f'user{i:02d}', email=f'user{i:02d}@example.com',
+                              team=teams[i % 2])
+        for i in range(25)
+    ]
+
+
+# QuerySet path
+
+def test_queryset_paginates_in_database(members, rf, django_assert_num_queries):
+    with django_assert_num_queries(2):  # COUNT, then one page joined with its team
+        context = build_table_context(Member.objects.all(), COLUMNS, rf.get('/m/', {'page': '3'}))
+        rows = list(context['rows'])
+        teams = [row.team.name for row in rows]
+
+    assert context['total_records'] == 25
+    assert context['total_pages'] == 3
+    assert context['current_page'] == 3
+    assert [row.name for row in rows] == ['user20', 'user21', 'user22', 'user23', 'user24']
+    assert teams == ['Blue', 'Red', 'Blue', 'Red', 'Blue']
+
+
+def test_queryset_without_ordering_is_ordered_by_pk(members, rf):
+    context = build_table_context(Member.objects.all(), COLUMNS, rf.get('/m/'))
+
+    assert context['rows'].query.order_by == ('pk',)
+
+
+def test_queryset_search_and_sort(members, rf):
+    request = rf.get('/m/', {'search': 'USER1', 'sort': 'name', 'direction': 'desc'})
+    context = build_table_context(Member.objects.all(), COLUMNS, request, page_size=5)
+
+    assert context['total_records'] == 10
+    assert [row.name for row in context['rows']][:3] == ['user19', 'user18', 'user17']
+    assert context['pagination_data']['next_url'] == (
+        '/m/?search=USER1&sort=name&direction=desc&page=2')
+
+
+def test_queryset_sort_by_property_is_ignored(members, rf):
+    request = rf.get('/m/', {'sort': 'display_name'})
+    context = build_table_context(Member.objects.all(), COLUMNS, request)
+
+    assert [row.name for row in context['rows']][:2] == ['user00', 'user01']
+
+
+def test_queryset_page_out_of_range_or_invalid(members, rf):
+    for raw_page, expected in (('99', 3), ('0', 1), ('abc', 1), ('9' * 5000, 1)):
+        request = rf.get('/m/', {'page': raw_page})
+        context = build_table_context(Member.objects.all(), COLUMNS, request)
+        assert context['current_page'] == expected
+
+
+def test_queryset_generic_foreign_key_is_prefetched(members, rf, django_assert_num_queries):
+    content_type = ContentType.objects.get_for_model(Member)
+    for member in members[:3]:
+        Note.objects.create(text=f'note for {member.name}', content_type=content_type,
+                            object_id=member.pk)
+    columns = [{'key': 'text'}, {'key': 'content_object'}]
+
+    context = build_table_context(Note.objects.all(), columns, rf.get('/n/', {'search': 'note'}))
+    # The content type is cached after the setup above: one query for the page,
+    # one for the prefetched members
+    with django_assert_num_queries(2):
+        objects = [row.content_object for row in context['rows']]
+
+    assert objects == members[:3]
+
+
+# Override path
+
+def test_overrides_returning_lists(members, rf):
+    request = rf.get('/m/', {'search': 'user', 'sort': 'display_name', 'direction': 'desc'})
+    context = build_table_context(
+        Member.objects.all(), COLUMNS, request, page_size=5,
+        filter_rows=lambda rows, query: [row for row in rows if query in row.name],
+        sort_rows=lambda rows, key, desc: sorted(rows, key=attrgetter(key), reverse=desc),
+    )
+
+    assert context['total_records'] == 25
+    assert [row.name for row in context['rows']] == [
+        'user24', 'user23', 'user22', 'user21', 'user20']
+
+
+def test_sort_override_returning_queryset(members, rf):
+    context = build_table_context(
+        Member.objects.all(), COLUMNS, rf.get('/m/', {'sort': 'name'}),
+        sort_rows=lambda rows, key, desc: rows.order_by('-email'),
+    )
+
+    assert context['rows'][0].name == 'user24'
+
+
+# List path
+
+ROWS = [
+    {'name': 'Charlie', 'email': 'charlie@example.com', 'team': 'Red'},
+    {'name': 'alice', 'email': 'alice@example.com', 'team': 'Blue'},
+    {'name': 'Bob', 'email': 'bob@example.com'},
+]
+
+
+def test_list_search_is_case_insensitive(rf):
+    context = build_table_context(ROWS, COLUMNS, rf.get('/l/', {'search': 'ALI'}))
+
+    assert context['rows'] == [ROWS[1]]
+    assert context['total_records'] == 1
+
+
+def test_list_search_skips_missing_keys(rf):
+    context = build_table_context(ROWS, COLUMNS, rf.get('/l/', {'search': 'none'}))
+
+    assert context['rows'] == []
+
+
+def test_list_sort_puts_missing_values_last(rf):
+    context = build_table_context(ROWS, COLUMNS, rf.get('/l/', {'sort': 'team'}))
+    assert [row['name'] for row in context['rows']] == ['alice', 'Charlie', 'Bob']
+
+    request = rf.get('/l/', {'sort': 'team', 'direction': 'desc'})
+    context = build_table_context(ROWS, COLUMNS, request)
+    assert [row['name'] for row in context['rows']] == ['Bob', 'Charlie', 'alice']
+
+
+def test_list_pagination(rf):
+    rows = [{'name': f'row{i}'} for i in range(12)]
+    context = build_table_context(rows, COLUMNS, rf.get('/l/', {'page': '2'}), page_size=5,
+                                  base_url='/rows/')
+
+    assert context['rows'] == rows[5:10]
+    assert context['pagination_data']['prev_url'] == '/rows/?page=1'
+    assert context['pagination_data']['next_url'] == '/rows/?page=3'
@@ -0,0 +1,31 @@
+"""Tests for adalex_ui.utils.build_pagination_data"""
+
+import pytest
+
+from adalex_ui.utils import build_pagination_data
+
+
+def test_pages_with_ellipsis():
+    pagination = build_pagination_data(5, 10, '/items/?page={page}')
+
+    assert [page['number'] for page in pagination['pages']] == [1, None, 4, 5, 6, None, 10]
+    assert [page['is_active'] for page in pagination['pages']].index(True) == 3
+    assert pagination['prev_url'] == '/items/?page=4'
+    assert pagination['next_url'] == '/items/?page=6'
+
+
+def test_every_placeholder_is_replaced():
+    pagination = build_pagination_data(2, 3, '/items/{page}/?page={page}')
+
+    assert [page['url'] for page in pagination['pages']] == [
+        '/items/1/?page=1', '/items/2/?page=2', '/items/3/?page=3']
+    assert pagination['prev_url'] == '/items/1/?page=1'
+    assert pagination['next_url'] == '/items/3/?page=3'
+
+
+def test_pages_are_read_only():
+    page = build_pagination_data(1, 3, '/items/?page={page}')['pages'][0]
+
+    with pytest.raises(TypeError):
+        page['url'] = '/other/'
+    assert dict(page, url='/other/')['url'] == '/other/'